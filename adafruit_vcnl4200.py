@@ -34,15 +34,14 @@ Implementation Notes
 import time
 
 from adafruit_bus_device.i2c_device import I2CDevice
-from adafruit_register.i2c_bit import ROBit, RWBit
-from adafruit_register.i2c_bits import RWBits
-from adafruit_register.i2c_struct import ROUnaryStruct, Struct, UnaryStruct
+from adafruit_register.i2c_struct import UnaryStruct
 from micropython import const
 
 try:
     import typing
 
     from busio import I2C
+    from circuitpython_typing import WriteableBuffer
 except ImportError:
     pass
 
@@ -66,83 +65,228 @@ _WHITE_DATA = const(0x0A)  # White sensor register
 _INT_FLAG = const(0x0D)  # Interrupt flag register
 _ID = const(0x0E)  # Device ID register
 
+_PS_TRIG = const(0x0004)  # PS_CONF3MS active force trigger, self-clearing
+
 # Interrupt flags
-_INTFLAG_PROX_UPFLAG = const(0x80)  # Proximity code saturation flag
-_INTFLAG_PROX_SPFLAG = const(0x40)  # Proximity sunlight protection flag
-_INTFLAG_ALS_LOW = const(0x20)  # ALS interrupt flag
-_INTFLAG_ALS_HIGH = const(0x10)  # Proximity interrupt flag
-_INTFLAG_PROX_CLOSE = const(0x02)  # Proximity THDH trigger
-_INTFLAG_PROX_AWAY = const(0x01)  # Proximity THDL trigger
+INTFLAG_PROX_UPFLAG = const(0x80)  # Proximity code saturation flag
+INTFLAG_PROX_SPFLAG = const(0x40)  # Proximity sunlight protection flag
+INTFLAG_ALS_LOW = const(0x20)  # ALS THDL trigger
+INTFLAG_ALS_HIGH = const(0x10)  # ALS THDH trigger
+INTFLAG_PROX_CLOSE = const(0x02)  # Proximity THDH trigger
+INTFLAG_PROX_AWAY = const(0x01)  # Proximity THDL trigger
+
+# Each setting is an integer constant, e.g. ``PS_INT_BOTH``, and is also listed by name
+# in its settings dict, e.g. ``PS_INT["BOTH"]``. The names indexed by value are used by
+# the getters and the sets of valid values by the setters.
 
 # ALS Integration Time settings
+ALS_IT_50MS = const(0x00)  # 50 ms integration time
+ALS_IT_100MS = const(0x01)  # 100 ms integration time
+ALS_IT_200MS = const(0x02)  # 200 ms integration time
+ALS_IT_400MS = const(0x03)  # 400 ms integration time
 ALS_IT = {
-    "50MS": const(0x00),  # 50 ms integration time
-    "100MS": const(0x01),  # 100 ms integration time
-    "200MS": const(0x02),  # 200 ms integration time
-    "400MS": const(0x03),  # 400 ms integration time
+    "50MS": ALS_IT_50MS,
+    "100MS": ALS_IT_100MS,
+    "200MS": ALS_IT_200MS,
+    "400MS": ALS_IT_400MS,
 }
+_ALS_IT_NAMES = ("50MS", "100MS", "200MS", "400MS")
 
 # ALS Persistence settings
+ALS_PERS_1 = const(0x00)  # ALS persistence 1 conversion
+ALS_PERS_2 = const(0x01)  # ALS persistence 2 conversions
+ALS_PERS_4 = const(0x02)  # ALS persistence 4 conversions
+ALS_PERS_8 = const(0x03)  # ALS persistence 8 conversions
 ALS_PERS = {
-    "1": const(0x00),  # ALS persistence 1 conversion
-    "2": const(0x01),  # ALS persistence 2 conversions
-    "4": const(0x02),  # ALS persistence 4 conversions
-    "8": const(0x03),  # ALS persistence 8 conversions
+    "1": ALS_PERS_1,
+    "2": ALS_PERS_2,
+    "4": ALS_PERS_4,
+    "8": ALS_PERS_8,
 }
+_ALS_PERS_NAMES = ("1", "2", "4", "8")
 
 # Proximity Sensor Integration Time settings
+PS_IT_1T = const(0x00)  # Proximity integration time 1T
+PS_IT_2T = const(0x01)  # Proximity integration time 2T
+PS_IT_3T = const(0x02)  # Proximity integration time 3T
+PS_IT_4T = const(0x03)  # Proximity integration time 4T
+PS_IT_8T = const(0x04)  # Proximity integration time 8T
+PS_IT_9T = const(0x05)  # Proximity integration time 9T
 PS_IT = {
-    "1T": const(0x00),  # Proximity integration time 1T
-    "2T": const(0x01),  # Proximity integration time 2T
-    "3T": const(0x02),  # Proximity integration time 3T
-    "4T": const(0x03),  # Proximity integration time 4T
-    "8T": const(0x04),  # Proximity integration time 8T
-    "9T": const(0x05),  # Proximity integration time 9T
+    "1T": PS_IT_1T,
+    "2T": PS_IT_2T,
+    "3T": PS_IT_3T,
+    "4T": PS_IT_4T,
+    "8T": PS_IT_8T,
+    "9T": PS_IT_9T,
 }
+_PS_IT_NAMES = ("1T", "2T", "3T", "4T", "8T", "9T")
 
 # Proximity Sensor Persistence settings
+PS_PERS_1 = const(0x00)  # Proximity persistence 1 conversion
+PS_PERS_2 = const(0x01)  # Proximity persistence 2 conversions
+PS_PERS_3 = const(0x02)  # Proximity persistence 3 conversions
+PS_PERS_4 = const(0x03)  # Proximity persistence 4 conversions
 PS_PERS = {
-    "1": const(0x00),  # Proximity persistence 1 conversion
-    "2": const(0x01),  # Proximity persistence 2 conversions
-    "3": const(0x02),  # Proximity persistence 3 conversions
-    "4": const(0x03),  # Proximity persistence 4 conversions
+    "1": PS_PERS_1,
+    "2": PS_PERS_2,
+    "3": PS_PERS_3,
+    "4": PS_PERS_4,
 }
+_PS_PERS_NAMES = ("1", "2", "3", "4")
 
 # Proximity Sensor Duty settings
+PS_DUTY_1_160 = const(0x00)  # Proximity duty cycle 1/160
+PS_DUTY_1_320 = const(0x01)  # Proximity duty cycle 1/320
+PS_DUTY_1_640 = const(0x02)  # Proximity duty cycle 1/640
+PS_DUTY_1_1280 = const(0x03)  # Proximity duty cycle 1/1280
 PS_DUTY = {
-    "1_160": const(0x00),  # Proximity duty cycle 1/160
-    "1_320": const(0x01),  # Proximity duty cycle 1/320
-    "1_640": const(0x02),  # Proximity duty cycle 1/640
-    "1_1280": const(0x03),  # Proximity duty cycle 1/1280
+    "1_160": PS_DUTY_1_160,
+    "1_320": PS_DUTY_1_320,
+    "1_640": PS_DUTY_1_640,
+    "1_1280": PS_DUTY_1_1280,
 }
+_PS_DUTY_NAMES = ("1_160", "1_320", "1_640", "1_1280")
 
 # Proximity Sensor Interrupt settings
+PS_INT_DISABLE = const(0x00)  # Proximity interrupt disabled
+PS_INT_CLOSE = const(0x01)  # Proximity interrupt when an object is close
+PS_INT_AWAY = const(0x02)  # Proximity interrupt when an object is away
+PS_INT_BOTH = const(0x03)  # Proximity interrupt for both close and away
 PS_INT = {
-    "DISABLE": const(0x00),  # Proximity interrupt disabled
-    "CLOSE": const(0x01),  # Proximity interrupt when an object is close
-    "AWAY": const(0x02),  # Proximity interrupt when an object is away
-    "BOTH": const(0x03),  # Proximity interrupt for both close and away
+    "DISABLE": PS_INT_DISABLE,
+    "CLOSE": PS_INT_CLOSE,
+    "AWAY": PS_INT_AWAY,
+    "BOTH": PS_INT_BOTH,
 }
+_PS_INT_NAMES = ("DISABLE", "CLOSE", "AWAY", "BOTH")
 
 # LED Current settings
+LED_I_50MA = const(0x00)  # LED current 50mA
+LED_I_75MA = const(0x01)  # LED current 75mA
+LED_I_100MA = const(0x02)  # LED current 100mA
+LED_I_120MA = const(0x03)  # LED current 120mA
+LED_I_140MA = const(0x04)  # LED current 140mA
+LED_I_160MA = const(0x05)  # LED current 160mA
+LED_I_180MA = const(0x06)  # LED current 180mA
+LED_I_200MA = const(0x07)  # LED current 200mA
 LED_I = {
-    "50MA": const(0x00),  # LED current 50mA
-    "75MA": const(0x01),  # LED current 75mA
-    "100MA": const(0x02),  # LED current 100mA
-    "120MA": const(0x03),  # LED current 120mA
-    "140MA": const(0x04),  # LED current 140mA
-    "160MA": const(0x05),  # LED current 160mA
-    "180MA": const(0x06),  # LED current 180mA
-    "200MA": const(0x07),  # LED current 200mA
+    "50MA": LED_I_50MA,
+    "75MA": LED_I_75MA,
+    "100MA": LED_I_100MA,
+    "120MA": LED_I_120MA,
+    "140MA": LED_I_140MA,
+    "160MA": LED_I_160MA,
+    "180MA": LED_I_180MA,
+    "200MA": LED_I_200MA,
 }
+_LED_I_NAMES = ("50MA", "75MA", "100MA", "120MA", "140MA", "160MA", "180MA", "200MA")
 
 # Proximity Sensor Multi Pulse settings
+PS_MPS_1 = const(0x00)  # Proximity multi pulse 1
+PS_MPS_2 = const(0x01)  # Proximity multi pulse 2
+PS_MPS_4 = const(0x02)  # Proximity multi pulse 4
+PS_MPS_8 = const(0x03)  # Proximity multi pulse 8
 PS_MPS = {
-    "1": const(0x00),  # Proximity multi pulse 1
-    "2": const(0x01),  # Proximity multi pulse 2
-    "4": const(0x02),  # Proximity multi pulse 4
-    "8": const(0x03),  # Proximity multi pulse 8
+    "1": PS_MPS_1,
+    "2": PS_MPS_2,
+    "4": PS_MPS_4,
+    "8": PS_MPS_8,
 }
+_PS_MPS_NAMES = ("1", "2", "4", "8")
+
+
+def retry(func: typing.Callable[[], typing.Any], attempts: int = 2) -> typing.Any:
+    """Call ``func`` and return its result, calling it again if it raises `OSError`.
+    Useful for riding out an occasional I2C bus glitch, for example
+    ``retry(sensor.trigger_prox)`` or ``retry(lambda: sensor.als_interrupt(True, False))``.
+
+    :param func: The zero-argument callable to run.
+    :param int attempts: The total number of calls to make before the error propagates.
+    """
+    for _ in range(attempts - 1):
+        try:
+            return func()
+        except OSError:
+            pass
+    return func()
+
+
+def _validate(value: int, names: typing.Tuple[str, ...], name: str) -> int:
+    """Return ``value`` if it is a valid code for the setting listed in ``names``,
+    otherwise raise `ValueError`. Setting codes run from 0 with no gaps."""
+    if not isinstance(value, int) or not 0 <= value < len(names):
+        raise ValueError(f"Invalid {name}: {value}")
+    return value
+
+
+class _ConfigBits:
+    """Bit field within one of the 16-bit configuration registers. Reads come from the
+    driver's cached copy of the register and writes push the whole word in a single
+    I2C write, so neither costs a read-modify-write on the bus. Writing the value a
+    field already holds is skipped entirely.
+
+    :param int num_bits: The number of bits in the field.
+    :param int register: The configuration register address.
+    :param int lowest_bit: The lowest bit's index within the 16-bit register.
+    """
+
+    def __init__(self, num_bits: int, register: int, lowest_bit: int) -> None:
+        self._register = register
+        self._lowest_bit = lowest_bit
+        self._mask = ((1 << num_bits) - 1) << lowest_bit
+
+    def __get__(self, obj, objtype=None) -> int:
+        if obj is None:
+            return self
+        return (obj._shadow[self._register] & self._mask) >> self._lowest_bit
+
+    def __set__(self, obj, value: int) -> None:
+        reg = obj._shadow[self._register]
+        new = (reg & ~self._mask) | ((value << self._lowest_bit) & self._mask)
+        if new != reg:
+            obj._write_reg16(self._register, new)
+
+
+class _ConfigBit(_ConfigBits):
+    """Single bit within one of the 16-bit configuration registers, read back as a bool.
+
+    :param int register: The configuration register address.
+    :param int bit: The bit's index within the 16-bit register.
+    """
+
+    def __init__(self, register: int, bit: int) -> None:
+        super().__init__(1, register, bit)
+
+    def __get__(self, obj, objtype=None) -> bool:
+        if obj is None:
+            return self
+        return bool(super().__get__(obj, objtype))
+
+    def __set__(self, obj, value: bool) -> None:
+        super().__set__(obj, 1 if value else 0)
+
+
+class _ConfigBatch:
+    """Context manager returned by `Adafruit_VCNL4200.batch`. Defers configuration
+    register writes until the outermost ``with`` block exits.
+
+    :param Adafruit_VCNL4200 sensor: The sensor whose configuration writes to defer.
+    """
+
+    def __init__(self, sensor: "Adafruit_VCNL4200") -> None:
+        self._sensor = sensor
+        self._nested = False
+
+    def __enter__(self) -> "Adafruit_VCNL4200":
+        self._nested = self._sensor._dirty is not None
+        if not self._nested:
+            self._sensor._dirty = []
+        return self._sensor
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if not self._nested:
+            self._sensor._flush()
 
 
 class Adafruit_VCNL4200:
@@ -153,11 +297,13 @@ class Adafruit_VCNL4200:
     :param addr: I2C Address if not using default
     """
 
+    __slots__ = ("_buf2", "_buf3", "_dirty", "_reg_buf", "_shadow", "i2c_device")
+
     # Device ID expected value for VCNL4200
     _DEVICE_ID = 0x1058
 
     # Register for ALS configuration
-    als_shutdown = RWBits(1, _ALS_CONF, 0)  # ALS shutdown bit
+    als_shutdown = _ConfigBit(_ALS_CONF, 0)  # ALS shutdown bit
     """Enables or disables the ALS (Ambient Light Sensor) shutdown mode.
     Controls the power state of the ALS, allowing it to be shut down to conserve power.
     Set to true to enable shutdown mode (power off ALS), false to disable (power on ALS)."""
@@ -168,53 +314,49 @@ class Adafruit_VCNL4200:
     als_threshold_high = UnaryStruct(_ALS_THDH, "<H")
     """The 16-bit numerical upper limit for proximity detection.If the proximity reading
     exceeds this threshold and the interrupt is enabled, an interrupt will be triggered."""
-    prox_hd = RWBit(_PS_CONF12, 11)
+    prox_hd = _ConfigBit(_PS_CONF12, 11)
     """The proximity sensor (PS) resolution to high definition (HD). Set to True to enable
     high definition mode (16-bit resolution), False for standard resolution (12-bit)."""
-    prox_shutdown = RWBit(_PS_CONF12, 0)  # Bit 0: PS_SD (Proximity Sensor Shutdown)
+    prox_shutdown = _ConfigBit(_PS_CONF12, 0)  # Bit 0: PS_SD (Proximity Sensor Shutdown)
     """The proximity sensor (PS) shutdown mode. Set to True to enable shutdown mode
     (power off proximity sensor), false to disable (power on proximity sensor)."""
-    proximity = ROUnaryStruct(_PS_DATA, "<H")
-    """The current proximity data from the proximity sensor (PS)."""
-    lux = ROUnaryStruct(_ALS_DATA, "<H")
-    """The current lux data from ambient light sensor (ALS)"""
-    _prox_multi_pulse = RWBits(2, _PS_CONF3MS, 5, register_width=2)
-    _prox_interrupt = RWBits(2, _PS_CONF12, 8, register_width=2)
-    _prox_duty = RWBits(2, _PS_CONF12, 6, register_width=2)
-    _prox_integration_time = RWBits(3, _PS_CONF12, 1, register_width=2)
-    _prox_persistence = RWBits(2, _PS_CONF12, 4, register_width=2)
-    prox_sun_cancellation = RWBit(_PS_CONF3MS, 0, register_width=2)
+    _prox_multi_pulse = _ConfigBits(2, _PS_CONF3MS, 5)
+    _prox_interrupt = _ConfigBits(2, _PS_CONF12, 8)
+    _prox_duty = _ConfigBits(2, _PS_CONF12, 6)
+    _prox_integration_time = _ConfigBits(3, _PS_CONF12, 1)
+    _prox_persistence = _ConfigBits(2, _PS_CONF12, 4)
+    prox_sun_cancellation = _ConfigBit(_PS_CONF3MS, 0)
     """The sunlight cancellation feature for the proximity sensor (PS).
     Controls the sunlight cancellation feature, which improves proximity
     detection accuracy in bright or sunny conditions by mitigating background
     light interference. Set to true to enable sunlight cancellation, false to disable
     it."""
-    prox_sunlight_double_immunity = RWBit(_PS_CONF3MS, 1, register_width=2)
+    prox_sunlight_double_immunity = _ConfigBit(_PS_CONF3MS, 1)
     """Double immunity mode to sunlight for the proximity
     sensor (PS). Configures an enhanced sunlight immunity mode, which increases the sensor’s
     ability to filter out interference from bright sunlight for improved proximity detection.
     Set to True to enable double sunlight immunity, False to disable it."""
-    prox_active_force = RWBit(_PS_CONF3MS, 3, register_width=2)
+    prox_active_force = _ConfigBit(_PS_CONF3MS, 3)
     """The active force mode for the proximity sensor (PS). Configures the proximity
     sensor to operate in active force mode, where measurements are taken only when
     manually triggered by `trigger_prox()`. Set to True to enable active force mode,
     False to disable it."""
-    prox_smart_persistence = RWBit(_PS_CONF3MS, 4, register_width=2)
+    prox_smart_persistence = _ConfigBit(_PS_CONF3MS, 4)
     """The smart persistence mode for the proximity sensor (PS).
     Configures the smart persistence feature, which helps reduce false triggers
     by adjusting the persistence behavior based on ambient conditions.
     Set to True to enable smart persistence, False to disable it."""
-    sun_protect_polarity = RWBit(_PS_CONF3MS, 3 + 8, register_width=2)
+    sun_protect_polarity = _ConfigBit(_PS_CONF3MS, 3 + 8)
     """The polarity of the sunlight protection output for the proximity sensor (PS).
     Configures the polarity of the sunlight protection output signal, which
     affects how sunlight interference is managed in proximity detection.
     Set to True for active high polarity, False for active low polarity."""
-    prox_boost_typical_sunlight_capability = RWBit(_PS_CONF3MS, 4 + 8, register_width=2)
+    prox_boost_typical_sunlight_capability = _ConfigBit(_PS_CONF3MS, 4 + 8)
     """The boosted sunlight protection capability for the proximity sensor (PS).
     Boosts the proximity sensor's resistance to typical sunlight interference for
     more reliable proximity measurements in bright ambient conditions.
     Set to true to enable boosted sunlight protection, false to disable it."""
-    prox_interrupt_logic_mode = RWBit(_PS_CONF3MS, 7 + 8, register_width=2)
+    prox_interrupt_logic_mode = _ConfigBit(_PS_CONF3MS, 7 + 8)
     """The interrupt logic mode for the proximity sensor (PS). Configures
     the interrupt output logic mode for the proximity sensor, determining if
     the interrupt signal is active high or active low. Set to True for active
@@ -239,62 +381,210 @@ class Adafruit_VCNL4200:
     Configures the upper limit for proximity detection. If the proximity reading
     exceeds this threshold and the interrupt is enabled, an interrupt will be
     triggered."""
-    _interrupt_flags = RWBits(8, _INT_FLAG, 0, register_width=2)
-    _prox_led_current = RWBits(3, _PS_CONF3MS, 8, register_width=2)
-    white_light = ROUnaryStruct(_WHITE_DATA, "<H")  # 16-bit register for white light data
-    """The current white light data. The 16-bit numerical raw white light measurement, representing
-    the sensor’s sensitivity to white light."""
-    _als_int_time = RWBits(2, _ALS_CONF, 6, register_width=2)
-    _als_persistence = RWBits(2, _ALS_CONF, 2, register_width=2)
-    _als_int_en = RWBits(1, _ALS_CONF, 1)  # Bit 1: ALS interrupt enable
-    _als_int_switch = RWBits(1, _ALS_CONF, 5)  # Bit 5: ALS interrupt channel selection (white/ALS)
-    _proximity_int_en = RWBits(1, _PS_CONF12, 0)
-    _prox_trigger = RWBit(_PS_CONF3MS, 2)
-    _device_id = UnaryStruct(_ID, "<H")
-    _raw_interrupt_flags = UnaryStruct(_INT_FLAG, "<H")  # 2-byte read, big endian
+    _prox_led_current = _ConfigBits(3, _PS_CONF3MS, 8)
+    _als_int_time = _ConfigBits(2, _ALS_CONF, 6)
+    _als_persistence = _ConfigBits(2, _ALS_CONF, 2)
+    _als_int_en = _ConfigBits(1, _ALS_CONF, 1)  # Bit 1: ALS interrupt enable
+    _als_int_switch = _ConfigBits(1, _ALS_CONF, 5)  # Bit 5: ALS interrupt channel selection
 
     def __init__(self, i2c: I2C, addr: int = _I2C_ADDRESS) -> None:
         self.i2c_device = I2CDevice(i2c, addr)
-        if self._device_id != self._DEVICE_ID:
+        # Scratch buffers reused by every register access
+        self._buf2 = bytearray(2)
+        self._buf3 = bytearray(3)
+        self._reg_buf = bytearray(1)
+        # Configuration registers awaiting a write while batching, otherwise None
+        self._dirty = None
+        # Probe the ID and cache the configuration registers in one hold of
+        # the bus; bit fields are served from this copy, which is only
+        # refreshed from the sensor by reload_config().
+        with self.i2c_device as i2c:
+            device_id = self._read_word(i2c, _ID)
+            self._load_shadow(i2c)
+        if device_id != self._DEVICE_ID:
             raise RuntimeError("Device ID mismatch.")
         try:
-            self.als_shutdown = False
-            self.als_integration_time = ALS_IT["50MS"]
-            self.als_persistence = ALS_PERS["1"]
-            self.als_threshold_low = 0
-            self.als_threshold_high = 0xFFFF
-            self.als_interrupt(enabled=True, white_channel=False)
-            self.prox_duty = PS_DUTY["1_160"]
-            self.prox_shutdown = False
-            self.prox_integration_time = PS_IT["1T"]
-            self.prox_persistence = PS_PERS["1"]
+            # Build each configuration word up front so every register is
+            # written once, leaving reserved and unrelated bits untouched.
+            als_conf = self._shadow[_ALS_CONF] & ~0x00EF
+            als_conf |= ALS_IT_50MS << 6  # ALS_IT
+            als_conf |= ALS_PERS_1 << 2  # ALS_PERS
+            als_conf |= 1 << 1  # ALS_INT_EN, ALS_INT_SWITCH and ALS_SD left clear
+            ps_conf12 = self._shadow[_PS_CONF12] & ~0x00FF
+            ps_conf12 |= PS_DUTY_1_160 << 6  # PS_DUTY
+            ps_conf12 |= PS_PERS_1 << 4  # PS_PERS
+            ps_conf12 |= PS_IT_1T << 1  # PS_IT, PS_SD left clear
+            with self.i2c_device as i2c:
+                self._write_word(i2c, _ALS_CONF, als_conf)
+                self._write_word(i2c, _ALS_THDL, 0)
+                self._write_word(i2c, _ALS_THDH, 0xFFFF)
+                self._write_word(i2c, _PS_CONF12, ps_conf12)
+            self._shadow[_ALS_CONF] = als_conf
+            self._shadow[_PS_CONF12] = ps_conf12
         except Exception as error:
             raise RuntimeError(f"Failed to initialize: {error}") from error
 
-    def als_interrupt(self, enabled: bool, white_channel: bool) -> bool:
+    def reload_config(self) -> None:
+        """Re-reads the configuration registers from the sensor. The configuration
+        properties are served from a copy of these registers kept in memory, so call
+        this if the sensor may have been changed behind the driver's back, for example
+        after it lost power."""
+        with self.i2c_device as i2c:
+            self._load_shadow(i2c)
+
+    def _load_shadow(self, i2c: I2CDevice) -> None:
+        """Cache the configuration registers from an already locked device."""
+        self._shadow = {
+            _ALS_CONF: self._read_word(i2c, _ALS_CONF),
+            _PS_CONF12: self._read_word(i2c, _PS_CONF12),
+            _PS_CONF3MS: self._read_word(i2c, _PS_CONF3MS) & ~_PS_TRIG,
+        }
+
+    def _read_word(self, i2c: I2CDevice, register: int) -> int:
+        """Read a 16-bit little-endian register on an already locked device."""
+        buf = self._buf2
+        reg = self._reg_buf
+        reg[0] = register
+        i2c.write_then_readinto(reg, buf)
+        return buf[0] | buf[1] << 8
+
+    def _write_word(self, i2c: I2CDevice, register: int, value: int) -> None:
+        """Write a 16-bit little-endian register on an already locked device."""
+        buf = self._buf3
+        buf[0] = register
+        buf[1] = value & 0xFF
+        buf[2] = value >> 8
+        i2c.write(buf)
+
+    def _read_reg16(self, register: int) -> int:
+        """Read a 16-bit little-endian register."""
+        with self.i2c_device as i2c:
+            return self._read_word(i2c, register)
+
+    def _write_reg16(self, register: int, value: int) -> None:
+        """Write a 16-bit configuration register and update its cached copy. While
+        batching, only the cached copy is updated and the write is deferred."""
+        if self._dirty is not None:
+            self._shadow[register] = value
+            if register not in self._dirty:
+                self._dirty.append(register)
+            return
+        with self.i2c_device as i2c:
+            self._write_word(i2c, register, value)
+        self._shadow[register] = value
+
+    def _flush(self) -> None:
+        """Stop batching and write every configuration register changed meanwhile."""
+        dirty = self._dirty
+        self._dirty = None
+        if dirty:
+            with self.i2c_device as i2c:
+                for register in dirty:
+                    self._write_word(i2c, register, self._shadow[register])
+
+    def batch(self) -> _ConfigBatch:
+        """Groups configuration changes into as few I2C writes as possible. Inside the
+        ``with`` block, changes to the cached configuration settings only update the
+        driver's copy of the registers. Each changed register is then written once, in
+        a single bus session, when the block exits. The thresholds, the cancellation
+        level and `trigger_prox` are not cached and still take effect immediately.
+
+        .. code-block:: python
+
+            with sensor.batch():
+                sensor.prox_duty = PS_DUTY_1_320
+                sensor.prox_integration_time = PS_IT_8T
+                sensor.prox_persistence = PS_PERS_2
+        """
+        return _ConfigBatch(self)
+
+    def als_interrupt(self, enabled: bool, white_channel: bool) -> None:
         """Configure ALS interrupt settings, enabling or disabling
         the interrupt and selecting the interrupt channel.
 
-        :return bool: True if setting the values succeeded, False otherwise."""
-        try:
-            self._als_int_en = enabled
-            self._als_int_switch = white_channel
-            return True
-        except OSError:
-            return False
+        Bus errors raise `OSError`; wrap the call with `retry` to retry them."""
+        self._als_int_en = bool(enabled)
+        self._als_int_switch = bool(white_channel)
 
-    def trigger_prox(self) -> bool:
+    def trigger_prox(self) -> None:
         """Triggers a single proximity measurement manually in active force mode.
         Initiates a one-time proximity measurement in active force mode. This can be
         used when proximity measurements are not continuous and need to be triggered
         individually.
 
-        :return bool: True if triggering succeeded, False otherwise."""
-        try:
-            self._prox_trigger = True
-            return True
-        except OSError:
-            return False
+        Bus errors raise `OSError`; wrap the call with `retry` to retry them."""
+        # The trigger clears itself once the measurement completes, so it is
+        # written on top of the cached settings but never kept in the cache.
+        with self.i2c_device as i2c:
+            self._write_word(i2c, _PS_CONF3MS, self._shadow[_PS_CONF3MS] | _PS_TRIG)
+
+    def trigger_and_wait_prox(self, timeout_ms: int = 100) -> int:
+        """Triggers a single proximity measurement in active force mode and waits for it.
+        Rather than sleeping for the worst-case measurement time, this polls the trigger
+        bit, which the sensor clears once the measurement is done, backing off from 1 ms.
+        `prox_active_force` must be enabled.
+
+        :param int timeout_ms: The longest time to wait for the measurement, in milliseconds.
+        :return int: The new proximity reading."""
+        self.trigger_prox()
+        delay_ms = 1
+        waited_ms = 0
+        while self._read_reg16(_PS_CONF3MS) & _PS_TRIG:
+            if waited_ms >= timeout_ms:
+                raise RuntimeError("Timed out waiting for proximity measurement.")
+            delay_ms = min(delay_ms, timeout_ms - waited_ms)
+            time.sleep(delay_ms / 1000)
+            waited_ms += delay_ms
+            delay_ms *= 2
+        return self.proximity
+
+    @property
+    def proximity(self) -> int:
+        """The current proximity data from the proximity sensor (PS)."""
+        return self._read_reg16(_PS_DATA)
+
+    @property
+    def lux(self) -> int:
+        """The current lux data from ambient light sensor (ALS)"""
+        return self._read_reg16(_ALS_DATA)
+
+    @property
+    def white_light(self) -> int:
+        """The current white light data. The 16-bit numerical raw white light measurement,
+        representing the sensor’s sensitivity to white light."""
+        return self._read_reg16(_WHITE_DATA)
+
+    def read_all(self) -> typing.Tuple[int, int, int]:
+        """Reads the proximity, ambient light and white light data together.
+        All three data registers are read within one hold of the I2C bus, which is
+        cheaper than reading `proximity`, `lux` and `white_light` one after another,
+        so prefer it in polling loops that need more than one of them.
+
+        :return tuple: The ``(proximity, lux, white_light)`` raw 16-bit values."""
+        # The VCNL4200 does not auto-increment, so each data register is
+        # addressed with its own command code.
+        with self.i2c_device as i2c:
+            return (
+                self._read_word(i2c, _PS_DATA),
+                self._read_word(i2c, _ALS_DATA),
+                self._read_word(i2c, _WHITE_DATA),
+            )
+
+    def read_batch(self, samples: WriteableBuffer) -> None:
+        """Fills ``samples`` with back-to-back `read_all` readings, stored as interleaved
+        ``proximity, lux, white_light`` values. Use a buffer of 16-bit items whose length
+        is a multiple of 3, such as ``array.array("H", [0] * 3 * count)``. On a host
+        running Blinka the filled array can be handed straight to
+        ``numpy.frombuffer(samples, dtype=numpy.uint16).reshape(-1, 3)``.
+
+        Readings taken faster than the sensor's measurement period repeat the last value.
+
+        :param samples: The buffer to fill with raw 16-bit readings."""
+        for i in range(0, len(samples) - 2, 3):
+            with self.i2c_device as i2c:
+                samples[i] = self._read_word(i2c, _PS_DATA)
+                samples[i + 1] = self._read_word(i2c, _ALS_DATA)
+                samples[i + 2] = self._read_word(i2c, _WHITE_DATA)
 
     @property
     def prox_interrupt(self) -> str:
@@ -304,15 +594,11 @@ class Adafruit_VCNL4200:
 
         :return str: The interrupt mode for the proximity sensor.
         """
-        PS_INT_REVERSE = {value: key for key, value in PS_INT.items()}
-        # Return the mode name if available, otherwise return "Unknown"
-        return PS_INT_REVERSE.get(self._prox_interrupt, "Unknown")
+        return _PS_INT_NAMES[self._prox_interrupt]
 
     @prox_interrupt.setter
     def prox_interrupt(self, mode: int) -> None:
-        if mode not in PS_INT.values():
-            raise ValueError("Invalid interrupt mode")
-        self._prox_interrupt = mode
+        self._prox_interrupt = _validate(mode, _PS_INT_NAMES, "interrupt mode")
 
     @property
     def prox_duty(self) -> str:
@@ -321,15 +607,11 @@ class Adafruit_VCNL4200:
         which affects power consumption and response time.
 
         :return str: The duty cycle of the infrared emitter for the proximity sensor."""
-        # Reverse lookup dictionary for PS_DUTY
-        PS_DUTY_REVERSE = {value: key for key, value in PS_DUTY.items()}
-        return PS_DUTY_REVERSE.get(self._prox_duty, "Unknown")
+        return _PS_DUTY_NAMES[self._prox_duty]
 
     @prox_duty.setter
     def prox_duty(self, setting: int) -> None:
-        if setting not in PS_DUTY.values():
-            raise ValueError(f"Invalid proximity duty cycle setting: {setting}")
-        self._prox_duty = setting
+        self._prox_duty = _validate(setting, _PS_DUTY_NAMES, "proximity duty cycle setting")
 
     @property
     def als_integration_time(self) -> str:
@@ -337,16 +619,11 @@ class Adafruit_VCNL4200:
         the ambient light sensor to control sensitivity and range.
 
         :return str: The ALS integration time setting"""
-        # Reverse lookup dictionary for ALS_IT
-        ALS_IT_REVERSE = {value: key for key, value in ALS_IT.items()}
-        # Map the result to the setting name, defaulting to "Unknown" if unmatched
-        return ALS_IT_REVERSE.get(self._als_int_time, "Unknown")
+        return _ALS_IT_NAMES[self._als_int_time]
 
     @als_integration_time.setter
     def als_integration_time(self, it: int) -> None:
-        if it not in ALS_IT.values():
-            raise ValueError(f"Invalid ALS integration time setting: {it}")
-        self._als_int_time = it
+        self._als_int_time = _validate(it, _ALS_IT_NAMES, "ALS integration time setting")
 
     @property
     def als_persistence(self) -> str:
@@ -356,15 +633,11 @@ class Adafruit_VCNL4200:
 
         :return str: The current persistence setting
         """
-        # Reverse lookup dictionary for ALS_PERS
-        ALS_PERS_REVERSE = {value: key for key, value in ALS_PERS.items()}
-        return ALS_PERS_REVERSE.get(self._als_persistence, "Unknown")
+        return _ALS_PERS_NAMES[self._als_persistence]
 
     @als_persistence.setter
     def als_persistence(self, pers: int) -> None:
-        if pers not in ALS_PERS.values():
-            raise ValueError(f"Invalid ALS persistence setting: {pers}")
-        self._als_persistence = pers
+        self._als_persistence = _validate(pers, _ALS_PERS_NAMES, "ALS persistence setting")
 
     @property
     def prox_multi_pulse(self) -> str:
@@ -374,14 +647,11 @@ class Adafruit_VCNL4200:
 
         :return str: The number of infrared pulses configured for the proximity sensor
         """
-        PS_MP_REVERSE = {value: key for key, value in PS_MPS.items()}
-        return PS_MP_REVERSE.get(self._prox_multi_pulse, "Unknown")
+        return _PS_MPS_NAMES[self._prox_multi_pulse]
 
     @prox_multi_pulse.setter
     def prox_multi_pulse(self, setting: int) -> None:
-        if setting not in PS_MPS.values():
-            raise ValueError(f"Invalid PS_MPS setting: {setting}")
-        self._prox_multi_pulse = setting
+        self._prox_multi_pulse = _validate(setting, _PS_MPS_NAMES, "PS_MPS setting")
 
     @property
     def prox_integration_time(self) -> str:
@@ -391,15 +661,15 @@ class Adafruit_VCNL4200:
 
         :return str: The current integration time
         """
-        # Reverse lookup dictionary for PS_IT
-        PS_IT_REVERSE = {value: key for key, value in PS_IT.items()}
-        return PS_IT_REVERSE.get(self._prox_integration_time, "Unknown")
+        # PS_IT is 3 bits wide but only 6 of its 8 codes are defined
+        setting = self._prox_integration_time
+        return _PS_IT_NAMES[setting] if setting < len(_PS_IT_NAMES) else "Unknown"
 
     @prox_integration_time.setter
     def prox_integration_time(self, setting: int) -> None:
-        if setting not in PS_IT.values():
-            raise ValueError(f"Invalid proximity integration time setting: {setting}")
-        self._prox_integration_time = setting
+        self._prox_integration_time = _validate(
+            setting, _PS_IT_NAMES, "proximity integration time setting"
+        )
 
     @property
     def prox_persistence(self) -> str:
@@ -409,15 +679,11 @@ class Adafruit_VCNL4200:
 
         :return str: The current persistence setting
         """
-        # Reverse lookup dictionary for PS_PERS
-        PS_PERS_REVERSE = {value: key for key, value in PS_PERS.items()}
-        return PS_PERS_REVERSE.get(self._prox_persistence, "Unknown")
+        return _PS_PERS_NAMES[self._prox_persistence]
 
     @prox_persistence.setter
     def prox_persistence(self, setting: int) -> None:
-        if setting not in PS_PERS.values():
-            raise ValueError(f"Invalid proximity persistence setting: {setting}")
-        self._prox_persistence = setting
+        self._prox_persistence = _validate(setting, _PS_PERS_NAMES, "proximity persistence setting")
 
     @property
     def prox_led_current(self) -> str:
@@ -426,15 +692,23 @@ class Adafruit_VCNL4200:
         and power consumption of the sensor.
 
         :return str: The LED current setting"""
-        # Reverse lookup dictionary for PS_PERS
-        LED_I_REVERSE = {value: key for key, value in LED_I.items()}
-        return LED_I_REVERSE.get(self._prox_led_current, "Unknown")
+        return _LED_I_NAMES[self._prox_led_current]
 
     @prox_led_current.setter
     def prox_led_current(self, setting: int) -> None:
-        if setting not in LED_I.values():
-            raise ValueError(f"Invalid proximity IR LED current setting: {setting}")
-        self._prox_led_current = setting
+        self._prox_led_current = _validate(
+            setting, _LED_I_NAMES, "proximity IR LED current setting"
+        )
+
+    @property
+    def interrupt_flags_raw(self) -> int:
+        """The current interrupt flags from the sensor as a raw bitmask. Test it against
+        the ``INTFLAG_*`` constants, e.g. ``sensor.interrupt_flags_raw & INTFLAG_PROX_CLOSE``.
+        Cheaper than `interrupt_flags` for polling as no dict is built.
+
+        :return int: The high byte of the interrupt flag register
+        """
+        return self._read_reg16(_INT_FLAG) >> 8
 
     @property
     def interrupt_flags(self) -> typing.Dict[str, bool]:
@@ -442,16 +716,15 @@ class Adafruit_VCNL4200:
         interrupt status flags, which indicate various sensor states, such as
         threshold crossings or sunlight protection events.
 
-        :return dict: The current interrupt flag values
+        :return dict: The current interrupt flag values, decoded from `interrupt_flags_raw`
         """
-        # Read the full 16-bit register value and isolate the high byte
-        raw_value = (self._raw_interrupt_flags >> 8) & 0xFF
+        raw_value = self.interrupt_flags_raw
         # Interpret each flag based on the datasheet's bit definition
         return {
-            "ALS_HIGH": bool(raw_value & _INTFLAG_ALS_HIGH),
-            "PROX_CLOSE": bool(raw_value & _INTFLAG_PROX_CLOSE),
-            "ALS_LOW": bool(raw_value & _INTFLAG_ALS_LOW),
-            "PROX_AWAY": bool(raw_value & _INTFLAG_PROX_AWAY),
-            "PROX_SPFLAG": bool(raw_value & _INTFLAG_PROX_SPFLAG),
-            "PROX_UPFLAG": bool(raw_value & _INTFLAG_PROX_UPFLAG),
+            "ALS_HIGH": bool(raw_value & INTFLAG_ALS_HIGH),
+            "PROX_CLOSE": bool(raw_value & INTFLAG_PROX_CLOSE),
+            "ALS_LOW": bool(raw_value & INTFLAG_ALS_LOW),
+            "PROX_AWAY": bool(raw_value & INTFLAG_PROX_AWAY),
+            "PROX_SPFLAG": bool(raw_value & INTFLAG_PROX_SPFLAG),
+            "PROX_UPFLAG": bool(raw_value & INTFLAG_PROX_UPFLAG),
         }
@@ -6,57 +6,73 @@
 import time
 
 import board
-import busio
 
-from adafruit_vcnl4200 import LED_I, PS_INT, Adafruit_VCNL4200
+from adafruit_vcnl4200 import LED_I_50MA, PS_INT_BOTH, Adafruit_VCNL4200
+
+# IR LED drive current to test with, e.g. LED_I_75MA for more range
+LED_CURRENT = LED_I_50MA
 
 i2c = board.I2C()
 sensor = Adafruit_VCNL4200(i2c)
 
-print(" '''ALS Settings''' ")
-print(f"Lux Persistence Mode: {sensor.als_persistence}")
-print(f"Lux Integration Mode: {sensor.als_integration_time}")
-print(f"Lux Persistence Mode: {sensor.als_persistence}")
-sensor.als_threshold_low = 0
-print(f"Lux Low Threshold: {sensor.als_low_threshold}")
-sensor.als_threshold_high = 500
-print(f"Lux High Threshold: {sensor.als_high_threshold}")
-
-print(" '''Proximity Settings''' ")
-sensor.prox_interrupt = PS_INT["BOTH"]
-print(f"Proximity Interrupt Mode: {sensor.prox_interrupt}")
-sensor.prox_interrupt_logic_mode = False
-print(f"Proximity Interrupt Logic Mode: {sensor.prox_interrupt_logic_mode}")
-sensor.prox_int_threshold_low = 0
-print(f"Proximity Threshold Low: {sensor.prox_int_threshold_low}")
-sensor.prox_int_threshold_high = 500
-print(f"Proximity Threshold High: {sensor.prox_int_threshold_high}")
-sensor.prox_active_force = False
-print(f"Proximity Active Force: {sensor.prox_active_force}")
-sensor.prox_smart_persistence = False
-print(f"Proximity Smart Persistence: {sensor.prox_smart_persistence}")
-sensor.prox_led_current = LED_I["50MA"]
-print(f"Proximity IR LED Current: {sensor.prox_led_current}")
-sensor.prox_cancellation_level = 0
-print(f"Proximity Cancellation Level: {sensor.prox_cancellation_level}")
-print(f"Proximity Integration Mode: {sensor.prox_integration_time}")
-print(f"Proximity Persistence Mode: {sensor.prox_persistence}")
-print(f"Proximity Duty Cycle: {sensor.prox_duty}")
-
-print(" '''Proximity Sunlight Settings''' ")
-print(f"Sun Protect Polarity: {sensor.sun_protect_polarity}")
-sensor.prox_boost_typical_sunlight_capability = False
-print(
-    f"Proximity Boost Typical Sunlight Capability: {sensor.prox_boost_typical_sunlight_capability}"
-)
-sensor.prox_sun_cancellation = False
-print(f"Proximity Sun Cancellation: {sensor.prox_sun_cancellation}")
-sensor.prox_sunlight_double_immunity = False
-print(f"Proximity Sunlight Double Immunity: {sensor.prox_sunlight_double_immunity}")
+# Threshold and cancellation registers are not cached by the driver, so keep
+# the values written to them rather than reading them back over I2C.
+als_threshold_low = 0
+als_threshold_high = 500
+prox_int_threshold_low = 0
+prox_int_threshold_high = 500
+prox_cancellation_level = 0
+
+# Apply every setting first, then read the configuration back in one go.
+# Batching writes each configuration register only once, at the end of the
+# block. The configuration properties are served from the driver's cached
+# copy of the sensor's registers, so reading them back costs no I2C traffic.
+with sensor.batch():
+    sensor.als_threshold_low = als_threshold_low
+    sensor.als_threshold_high = als_threshold_high
+    sensor.prox_interrupt = PS_INT_BOTH
+    sensor.prox_interrupt_logic_mode = False
+    sensor.prox_int_threshold_low = prox_int_threshold_low
+    sensor.prox_int_threshold_high = prox_int_threshold_high
+    sensor.prox_active_force = False
+    sensor.prox_smart_persistence = False
+    sensor.prox_led_current = LED_CURRENT
+    sensor.prox_cancellation_level = prox_cancellation_level
+    sensor.prox_boost_typical_sunlight_capability = False
+    sensor.prox_sun_cancellation = False
+    sensor.prox_sunlight_double_immunity = False
+
+# Build the whole configuration report and send it to the console at once
+report = [
+    " '''ALS Settings''' ",
+    f"Lux Persistence Mode: {sensor.als_persistence}",
+    f"Lux Integration Mode: {sensor.als_integration_time}",
+    f"Lux Low Threshold: {als_threshold_low}",
+    f"Lux High Threshold: {als_threshold_high}",
+    " '''Proximity Settings''' ",
+    f"Proximity Interrupt Mode: {sensor.prox_interrupt}",
+    f"Proximity Interrupt Logic Mode: {sensor.prox_interrupt_logic_mode}",
+    f"Proximity Threshold Low: {prox_int_threshold_low}",
+    f"Proximity Threshold High: {prox_int_threshold_high}",
+    f"Proximity Active Force: {sensor.prox_active_force}",
+    f"Proximity Smart Persistence: {sensor.prox_smart_persistence}",
+    f"Proximity IR LED Current: {sensor.prox_led_current}",
+    f"Proximity Cancellation Level: {prox_cancellation_level}",
+    f"Proximity Integration Mode: {sensor.prox_integration_time}",
+    f"Proximity Persistence Mode: {sensor.prox_persistence}",
+    f"Proximity Duty Cycle: {sensor.prox_duty}",
+    " '''Proximity Sunlight Settings''' ",
+    f"Sun Protect Polarity: {sensor.sun_protect_polarity}",
+    f"Proximity Boost Typical Sunlight Capability: {sensor.prox_boost_typical_sunlight_capability}",
+    f"Proximity Sun Cancellation: {sensor.prox_sun_cancellation}",
+    f"Proximity Sunlight Double Immunity: {sensor.prox_sunlight_double_immunity}",
+]
+print("\n".join(report))
 
 print(f"Interrupt Flags: {sensor.interrupt_flags}")
-print(f"Proximity is: {sensor.proximity}")
-print(f"Ambient is: {sensor.lux}")
 
+# The configuration is fixed from here on, so each pass only reads the data
 while True:
-    pass
+    proximity, lux, white_light = sensor.read_all()
+    print(f"Proximity is: {proximity}\nAmbient is: {lux}\nWhite light is: {white_light}")
+    time.sleep(1)
@@ -8,7 +8,7 @@ import time
 import board
 import digitalio
 
-from adafruit_vcnl4200 import ALS_PERS, PS_INT, PS_PERS, Adafruit_VCNL4200
+from adafruit_vcnl4200 import ALS_PERS_1, PS_INT_BOTH, PS_PERS_1, Adafruit_VCNL4200
 
 i2c = board.I2C()
 sensor = Adafruit_VCNL4200(i2c)
@@ -23,10 +23,10 @@ sensor.prox_int_threshold_low = 200
 sensor.prox_int_threshold_high = 600
 
 sensor.als_interrupt(enabled=True, white_channel=False)
-sensor.prox_interrupt = PS_INT["BOTH"]
+sensor.prox_interrupt = PS_INT_BOTH
 sensor.prox_interrupt_logic_mode = False
-sensor.als_persistence = ALS_PERS["1"]
-sensor.prox_persistence = PS_PERS["1"]
+sensor.als_persistence = ALS_PERS_1
+sensor.prox_persistence = PS_PERS_1
 
 print("Monitoring interrupts...")
 
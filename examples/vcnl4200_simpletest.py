@@ -13,6 +13,9 @@ i2c = board.I2C()
 sensor = adafruit_vcnl4200.Adafruit_VCNL4200(i2c)
 
 while True:
-    print(f"Proximity is: {sensor.proximity}")
-    print(f"Ambient is: {sensor.lux}")
+    # Read proximity, ambient and white light together in one bus session
+    proximity, lux, white_light = sensor.read_all()
+    print(f"Proximity is: {proximity}")
+    print(f"Ambient is: {lux}")
+    print(f"White light is: {white_light}")
     time.sleep(0.1)